@@ -29,6 +29,12 @@ from urllib.parse import urljoin
 from flask import Flask, render_template, request, Response, jsonify
 import logging
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 app = Flask(__name__, static_url_path='/static')
 
 # Balanced logging - keep useful info, reduce noise
@@ -249,32 +255,36 @@ def run_semgrep_scan(target_dir: str, config: str = DEFAULT_SEMGREP_CONFIG, time
     ]
     
     logger.info(f"Running semgrep command: {' '.join(cmd)}")
-    proc = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout_sec)
+    # Keep stdout as bytes: the JSON decoder reads UTF-8 directly, so the
+    # (potentially large) report is never decoded to str first
+    proc = subprocess.run(cmd, capture_output=True, timeout=timeout_sec)
+    stderr = proc.stderr.decode("utf-8", "replace")
     
     logger.info(f"Semgrep exit code: {proc.returncode}")
-    logger.info(f"Semgrep stdout length: {len(proc.stdout or '')}")
-    logger.info(f"Semgrep stderr length: {len(proc.stderr or '')}")
+    logger.info(f"Semgrep stdout length: {len(proc.stdout or b'')}")
+    logger.info(f"Semgrep stderr length: {len(stderr)}")
     
-    if proc.stderr:
-        logger.warning(f"Semgrep stderr: {proc.stderr[:500]}")
+    if stderr:
+        logger.warning(f"Semgrep stderr: {stderr[:500]}")
 
     # semgrep exits 0 when no issues, 1 when issues found, >1 for errors
     if proc.returncode in (0, 1):
         try:
-            result = json.loads(proc.stdout or '{"results": []}')
+            result = _json_loads(proc.stdout or b'{"results": []}')
             logger.info(f"Semgrep found {len(result.get('results', []))} issues")
             return result
         except json.JSONDecodeError as e:
+            stdout_head = proc.stdout[:1000].decode("utf-8", "replace")
             logger.error(f"Failed to parse semgrep JSON: {e}")
-            logger.error(f"Raw stdout: {proc.stdout[:1000]}")
-            raise RuntimeError(f"Failed to parse semgrep JSON: {e}\nSTDOUT[:500]: {proc.stdout[:500]}")
+            logger.error(f"Raw stdout: {stdout_head}")
+            raise RuntimeError(f"Failed to parse semgrep JSON: {e}\nSTDOUT[:500]: {stdout_head[:500]}")
     
     # For non-zero/non-one exit codes, provide more detailed error info
     error_msg = f"Semgrep failed (code {proc.returncode})"
-    if proc.stderr:
-        error_msg += f": {proc.stderr[:300]}"
+    if stderr:
+        error_msg += f": {stderr[:300]}"
     if proc.stdout:
-        error_msg += f" | stdout: {proc.stdout[:300]}"
+        error_msg += f" | stdout: {proc.stdout[:300].decode('utf-8', 'replace')}"
     
     logger.error(error_msg)
     raise RuntimeError(error_msg)
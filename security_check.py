@@ -7,76 +7,293 @@ Scans code in /mnt/imported/code/ and generates a stylized PDF report
 import os
 import sys
 import json
+import mmap
 import subprocess
+import tempfile
 from datetime import datetime
-from pathlib import Path
 
 try:
     from reportlab.lib import colors
-    from reportlab.lib.pagesizes import letter, A4
+    from reportlab.lib.pagesizes import letter
     from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
     from reportlab.lib.units import inch
+    from reportlab.lib.utils import simpleSplit
+    from reportlab.pdfbase.pdfmetrics import stringWidth
     from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak
-    from reportlab.platypus import Image as RLImage
-    from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
-    REPORTLAB_AVAILABLE = True
+    from reportlab.lib.enums import TA_CENTER
+except ImportError as e:
+    # reportlab must be installed in the image; installing at runtime stalls cold start
+    print(f"ERROR: reportlab is required but not installed: {e}", file=sys.stderr)
+    sys.exit(3)
+
+try:
+    import orjson
+    _JSON_DECODE_ERRORS = (json.JSONDecodeError, orjson.JSONDecodeError)
 except ImportError:
-    print("WARNING: reportlab not available. Installing...")
-    subprocess.run([sys.executable, "-m", "pip", "install", "reportlab"], check=True)
-    from reportlab.lib import colors
-    from reportlab.lib.pagesizes import letter, A4
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.lib.units import inch
-    from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak
-    from reportlab.platypus import Image as RLImage
-    from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
+    orjson = None
+    _JSON_DECODE_ERRORS = (json.JSONDecodeError,)
+
+_SEMGREP_TIMEOUT = 600  # 10 minute timeout
+
+# Target filters: vendored and build output trees are never scanned
+_SEMGREP_EXCLUDES = ("node_modules", ".git", "vendor", "dist", "build")
+
+# Semgrep severity strings, as they appear in its JSON, to report severities.
+# Semgrep's ERROR/WARNING levels map to HIGH/MEDIUM as in app.summarize_semgrep,
+# but INFO stays INFO here (the dashboard folds it into LOW). Anything
+# unrecognized is reported as INFO. ERROR findings therefore make main exit 1.
+_SEVERITY_MAP = {
+    variant: severity
+    for raw, severity in (
+        ("CRITICAL", "CRITICAL"),
+        ("HIGH", "HIGH"),
+        ("ERROR", "HIGH"),
+        ("MEDIUM", "MEDIUM"),
+        ("WARNING", "MEDIUM"),
+        ("LOW", "LOW"),
+        ("INFO", "INFO"),
+    )
+    for variant in (raw, raw.lower(), raw.capitalize())
+}
+
+# The report lists at most this many findings per severity
+_REPORT_CAP_PER_SEVERITY = 20
+
+# Shared read-only default for missing nested finding fields; never mutate
+_EMPTY_DICT = {}
+
+# Report colors, parsed once at import
+_COLOR_HEADER_BG = colors.HexColor('#34495e')
+_COLOR_LABEL_BG = colors.HexColor('#ecf0f1')
+_COLOR_GRID = colors.HexColor('#bdc3c7')
+_COLOR_ROW_ALT = colors.HexColor('#f8f9fa')
+_COLOR_TITLE = colors.HexColor('#1a1a1a')
+_COLOR_SUBTITLE = colors.HexColor('#666666')
+_COLOR_HEADING = colors.HexColor('#2c3e50')
+_COLOR_SUCCESS = colors.HexColor('#27ae60')
+
+# Severity color mapping
+_SEVERITY_COLORS = {
+    'CRITICAL': colors.HexColor('#c0392b'),
+    'HIGH': colors.HexColor('#e74c3c'),
+    'MEDIUM': colors.HexColor('#f39c12'),
+    'LOW': colors.HexColor('#f1c40f'),
+    'INFO': colors.HexColor('#3498db')
+}
+
+# Paragraph text is parsed as mini-HTML; escape in a single translate pass
+_HTML_ESCAPE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;'})
+
+# Table styles are identical for every report; parse the command lists once
+_SUMMARY_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), _COLOR_HEADER_BG),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 12),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('TOPPADDING', (0, 0), (-1, 0), 12),
+    ('BACKGROUND', (0, 1), (-1, -1), _COLOR_LABEL_BG),
+    ('GRID', (0, 0), (-1, -1), 1, _COLOR_GRID),
+    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 1), (-1, -1), 10),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, _COLOR_ROW_ALT]),
+    ('TOPPADDING', (0, 1), (-1, -1), 8),
+    ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
+])
+
+_FINDING_FONT = 'Helvetica'
+_FINDING_FONT_SIZE = 9
+_FINDING_CELL_PADDING = 8
+_FINDING_COL_WIDTHS = (1.2*inch, 2.2*inch, 3.1*inch)
+_FINDING_TEXT_WIDTHS = tuple(w - 2*_FINDING_CELL_PADDING for w in _FINDING_COL_WIDTHS)
+
+_FINDING_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), _COLOR_LABEL_BG),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTNAME', (0, 1), (-1, -1), _FINDING_FONT),
+    ('FONTSIZE', (0, 0), (-1, -1), _FINDING_FONT_SIZE),
+    ('LEADING', (0, 1), (-1, -1), 11),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('GRID', (0, 0), (-1, -1), 0.5, _COLOR_GRID),
+    ('TOPPADDING', (0, 0), (-1, -1), 6),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+    ('LEFTPADDING', (0, 0), (-1, -1), _FINDING_CELL_PADDING),
+    ('RIGHTPADDING', (0, 0), (-1, -1), _FINDING_CELL_PADDING),
+])
+
+
+def _load_json_file(path):
+    """
+    Parse a non-empty JSON file straight from a read-only memory map
+    """
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if orjson is None:
+                return json.loads(mm[:])
+            # orjson reads the mapped pages directly, no intermediate bytes copy
+            with memoryview(mm) as buf:
+                return orjson.loads(buf)
 
 
-def run_semgrep_scan(target_dir):
+def _truncate_message(message):
     """
-    Run Semgrep scan on the target directory
-    Returns the scan results as a dictionary
+    Truncate long finding messages for the report
     """
-    print(f"Starting Semgrep scan on: {target_dir}")
+    # Single-character ellipsis keeps the full 200 characters for text
+    return (message[:199] + "\u2026") if len(message) > 200 else message
 
-    try:
-        # Run semgrep with auto config (uses registry rules)
+
+def _slim_finding(finding):
+    """
+    Keep only the fields of a Semgrep finding that the report uses
+    """
+    extra = finding.get("extra") or _EMPTY_DICT
+    start = finding.get("start") or _EMPTY_DICT
+    return {
+        "check_id": finding.get("check_id", "Unknown"),
+        "path": finding.get("path", "Unknown file"),
+        "start": {"line": start.get("line", "?")},
+        "extra": {
+            "severity": extra.get("severity", "INFO"),
+            "message": _truncate_message(extra.get("message", "No description")),
+        },
+    }
+
+
+def _scan_result(findings=(), errors=()):
+    """
+    Bucket findings by severity and package them with the scan errors
+    """
+    categorized, overflow = categorize_findings(findings)
+    # Per-severity totals, computed once for the report and the exit code
+    counts = {severity: len(bucket) + overflow[severity] for severity, bucket in categorized.items()}
+    return {
+        "categorized": categorized,
+        "overflow": overflow,
+        "counts": counts,
+        "total": sum(counts.values()),
+        "errors": list(errors),
+    }
+
+
+def _wrap_text(text, width, font_name=_FINDING_FONT, font_size=_FINDING_FONT_SIZE):
+    """
+    Wrap text to a column width for a plain-string table cell
+    Words wider than the column (rule ids, paths) are split across lines
+    """
+    lines = []
+    for line in simpleSplit(str(text), font_name, font_size, width):
+        start = 0
+        used = 0.0
+        for i, char in enumerate(line):
+            char_width = stringWidth(char, font_name, font_size)
+            if used + char_width > width and i > start:
+                lines.append(line[start:i])
+                start = i
+                used = 0.0
+            used += char_width
+        lines.append(line[start:])
+    return "\n".join(lines)
+
+
+def _escape_markup(text):
+    """
+    Escape text for use inside a reportlab Paragraph
+    """
+    text = str(text)
+    # Most text has no markup characters; the containment checks are cheaper than a copy
+    if '&' in text or '<' in text or '>' in text:
+        return text.translate(_HTML_ESCAPE)
+    return text
+
+
+def _semgrep_target_filters():
+    """
+    Build --include/--exclude arguments so Semgrep skips non-source trees up front
+    Every file type is scanned unless SEMGREP_INCLUDES (comma-separated globs)
+    narrows the targets
+    """
+    includes = os.environ.get("SEMGREP_INCLUDES", "")
+    args = [f"--include={pattern.strip()}" for pattern in includes.split(",") if pattern.strip()]
+    args.extend(f"--exclude={pattern}" for pattern in _SEMGREP_EXCLUDES)
+    return args
+
+
+def _semgrep_command(target_dir, *extra_args):
+    """
+    Build the Semgrep command line (auto config uses registry rules)
+    """
+    # One job per core; some images default semgrep to a single job.
+    # Metrics stay on: semgrep refuses --config=auto with --metrics=off.
+    return [
+        "semgrep", "scan", "--config=auto", "--json",
+        f"--jobs={os.cpu_count() or 1}",
+        "--disable-version-check",
+        *_semgrep_target_filters(),
+        *extra_args,
+        target_dir,
+    ]
+
+
+def _scan_to_file(target_dir):
+    """
+    Run Semgrep with its JSON report written to a temporary file, then parse it
+    Returns None if Semgrep produced no output
+    """
+    with tempfile.NamedTemporaryFile(suffix=".json") as tmp:
         result = subprocess.run(
-            ["semgrep", "scan", "--config=auto", "--json", target_dir],
-            capture_output=True,
-            text=True,
-            timeout=600  # 10 minute timeout
+            _semgrep_command(target_dir, "--output", tmp.name),
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            timeout=_SEMGREP_TIMEOUT
         )
 
         # Semgrep returns non-zero if findings are found, which is expected
-        output = result.stdout
-
-        if not output:
+        if os.path.getsize(tmp.name) == 0:
             print("WARNING: No output from Semgrep. Using stderr:")
-            print(result.stderr)
-            return {"results": [], "errors": []}
+            print(result.stderr.decode("utf-8", "replace"))
+            return None
 
-        scan_results = json.loads(output)
-        print(f"Scan complete. Found {len(scan_results.get('results', []))} findings.")
+        raw_results = _load_json_file(tmp.name)
+
+    return _scan_result(raw_results.get("results", []), raw_results.get("errors", []))
+
+
+def run_semgrep_scan(target_dir):
+    """
+    Run Semgrep scan on the target directory
+    Returns the categorized findings, per-severity overflow and total counts
+    and scan errors as a dictionary
+    """
+    print(f"Starting Semgrep scan on: {target_dir}")
+
+    try:
+        scan_results = _scan_to_file(target_dir)
+        if scan_results is None:
+            return _scan_result()
+
+        print(f"Scan complete. Found {scan_results['total']} findings.")
         return scan_results
 
     except subprocess.TimeoutExpired:
         print("ERROR: Semgrep scan timed out")
-        return {"results": [], "errors": ["Scan timed out"]}
-    except json.JSONDecodeError as e:
+        return _scan_result(errors=["Scan timed out"])
+    except _JSON_DECODE_ERRORS as e:
         print(f"ERROR: Failed to parse Semgrep output: {e}")
-        return {"results": [], "errors": [f"JSON parse error: {e}"]}
+        return _scan_result(errors=[f"JSON parse error: {e}"])
     except FileNotFoundError:
         print("ERROR: Semgrep not found. Please ensure it's installed.")
-        return {"results": [], "errors": ["Semgrep not installed"]}
+        return _scan_result(errors=["Semgrep not installed"])
     except Exception as e:
         print(f"ERROR: Unexpected error during scan: {e}")
-        return {"results": [], "errors": [str(e)]}
+        return _scan_result(errors=[str(e)])
 
 
-def categorize_findings(results):
+def categorize_findings(results, cap=_REPORT_CAP_PER_SEVERITY):
     """
-    Categorize findings by severity
+    Categorize findings by severity, keeping at most cap findings per severity
+    Returns (categories, overflow), where overflow counts the findings dropped per severity
     """
     categories = {
         "CRITICAL": [],
@@ -85,19 +302,25 @@ def categorize_findings(results):
         "LOW": [],
         "INFO": []
     }
+    overflow = dict.fromkeys(categories, 0)
 
     for finding in results:
-        severity = finding.get("extra", {}).get("severity", "INFO").upper()
-        if severity not in categories:
-            severity = "INFO"
-        categories[severity].append(finding)
+        extra = finding.get("extra") or _EMPTY_DICT
+        severity = _SEVERITY_MAP.get(extra.get("severity"), "INFO")
+        bucket = categories[severity]
+        # The report lists and slims only the first cap findings; count the rest
+        if len(bucket) < cap:
+            bucket.append(_slim_finding(finding))
+        else:
+            overflow[severity] += 1
 
-    return categories
+    return categories, overflow
 
 
 def generate_pdf_report(scan_results, output_path):
     """
     Generate a professional-looking PDF report from scan results
+    as returned by run_semgrep_scan
     """
     print(f"Generating PDF report: {output_path}")
 
@@ -122,7 +345,7 @@ def generate_pdf_report(scan_results, output_path):
         'CustomTitle',
         parent=styles['Heading1'],
         fontSize=28,
-        textColor=colors.HexColor('#1a1a1a'),
+        textColor=_COLOR_TITLE,
         spaceAfter=12,
         alignment=TA_CENTER,
         fontName='Helvetica-Bold'
@@ -132,7 +355,7 @@ def generate_pdf_report(scan_results, output_path):
         'CustomSubtitle',
         parent=styles['Normal'],
         fontSize=12,
-        textColor=colors.HexColor('#666666'),
+        textColor=_COLOR_SUBTITLE,
         spaceAfter=20,
         alignment=TA_CENTER,
         fontName='Helvetica'
@@ -142,7 +365,7 @@ def generate_pdf_report(scan_results, output_path):
         'CustomHeading',
         parent=styles['Heading2'],
         fontSize=16,
-        textColor=colors.HexColor('#2c3e50'),
+        textColor=_COLOR_HEADING,
         spaceAfter=12,
         spaceBefore=12,
         fontName='Helvetica-Bold'
@@ -154,56 +377,39 @@ def generate_pdf_report(scan_results, output_path):
     story.append(Spacer(1, 0.3*inch))
 
     # Summary Section
-    results = scan_results.get("results", [])
-    errors = scan_results.get("errors", [])
-
-    categorized = categorize_findings(results)
+    categorized = scan_results["categorized"]
+    overflow = scan_results["overflow"]
+    errors = scan_results["errors"]
+    counts = scan_results["counts"]
+    total_findings = scan_results["total"]
 
     # Summary Statistics Table
     story.append(Paragraph("Executive Summary", heading_style))
 
-    summary_data = [
-        ['Metric', 'Count'],
-        ['Total Findings', str(len(results))],
-        ['Critical', str(len(categorized['CRITICAL']))],
-        ['High', str(len(categorized['HIGH']))],
-        ['Medium', str(len(categorized['MEDIUM']))],
-        ['Low', str(len(categorized['LOW']))],
-        ['Info', str(len(categorized['INFO']))],
-    ]
+    summary_data = [['Metric', 'Count'], ['Total Findings', str(total_findings)]]
+    summary_data.extend([severity.capitalize(), str(count)] for severity, count in counts.items())
 
     summary_table = Table(summary_data, colWidths=[3.5*inch, 2.5*inch])
-    summary_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#34495e')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 12),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('TOPPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#ecf0f1')),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#bdc3c7')),
-        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 1), (-1, -1), 10),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f8f9fa')]),
-        ('TOPPADDING', (0, 1), (-1, -1), 8),
-        ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
-    ]))
+    summary_table.setStyle(_SUMMARY_TABLE_STYLE)
 
     story.append(summary_table)
     story.append(Spacer(1, 0.3*inch))
 
-    # Severity color mapping
-    severity_colors = {
-        'CRITICAL': colors.HexColor('#c0392b'),
-        'HIGH': colors.HexColor('#e74c3c'),
-        'MEDIUM': colors.HexColor('#f39c12'),
-        'LOW': colors.HexColor('#f1c40f'),
-        'INFO': colors.HexColor('#3498db')
+    # Severity header styles, built once rather than per severity section
+    severity_header_styles = {
+        severity: ParagraphStyle(
+            f'SeverityHeader{severity.title()}',
+            parent=styles['Heading3'],
+            fontSize=14,
+            textColor=color,
+            spaceAfter=10,
+            fontName='Helvetica-Bold'
+        )
+        for severity, color in _SEVERITY_COLORS.items()
     }
 
     # Detailed Findings
-    if results:
+    if total_findings:
         story.append(PageBreak())
         story.append(Paragraph("Detailed Findings", heading_style))
         story.append(Spacer(1, 0.2*inch))
@@ -213,55 +419,36 @@ def generate_pdf_report(scan_results, output_path):
             if findings:
                 # Severity header
                 severity_header = Paragraph(
-                    f"{severity} Severity ({len(findings)} findings)",
-                    ParagraphStyle(
-                        'SeverityHeader',
-                        parent=styles['Heading3'],
-                        fontSize=14,
-                        textColor=severity_colors[severity],
-                        spaceAfter=10,
-                        fontName='Helvetica-Bold'
-                    )
+                    f"{severity} Severity ({counts[severity]} findings)",
+                    severity_header_styles[severity]
                 )
                 story.append(severity_header)
 
-                # Findings table
-                for idx, finding in enumerate(findings[:20], 1):  # Limit to 20 per severity
-                    check_id = finding.get('check_id', 'Unknown')
-                    message = finding.get('extra', {}).get('message', 'No description')
-                    path = finding.get('path', 'Unknown file')
-                    line = finding.get('start', {}).get('line', '?')
-
-                    # Truncate long messages
-                    if len(message) > 200:
-                        message = message[:197] + "..."
-
-                    finding_data = [
-                        ['Rule', check_id],
-                        ['File', f"{path}:{line}"],
-                        ['Description', message],
-                    ]
-
-                    finding_table = Table(finding_data, colWidths=[1.2*inch, 5.3*inch])
-                    finding_table.setStyle(TableStyle([
-                        ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#ecf0f1')),
-                        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-                        ('FONTSIZE', (0, 0), (-1, -1), 9),
-                        ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
-                        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-                        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#bdc3c7')),
-                        ('TOPPADDING', (0, 0), (-1, -1), 6),
-                        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-                        ('LEFTPADDING', (0, 0), (-1, -1), 8),
-                        ('RIGHTPADDING', (0, 0), (-1, -1), 8),
-                    ]))
-
-                    story.append(finding_table)
-                    story.append(Spacer(1, 0.15*inch))
-
-                if len(findings) > 20:
+                # Findings table: one row per finding, a single Table per severity
+                rows = [['Rule', 'File', 'Description']]
+                # Capped and slimmed by categorize_findings; messages are already truncated
+                for finding in findings:
+                    check_id = finding['check_id']
+                    message = finding['extra']['message']
+                    path = finding['path']
+                    line = finding['start']['line']
+
+                    # Pre-wrapped plain strings: no Paragraph flowable or markup parsing per cell
+                    rows.append([
+                        _wrap_text(check_id, _FINDING_TEXT_WIDTHS[0]),
+                        _wrap_text(f"{path}:{line}", _FINDING_TEXT_WIDTHS[1]),
+                        _wrap_text(message, _FINDING_TEXT_WIDTHS[2]),
+                    ])
+
+                findings_table = Table(rows, colWidths=_FINDING_COL_WIDTHS, repeatRows=1)
+                findings_table.setStyle(_FINDING_TABLE_STYLE)
+
+                story.append(findings_table)
+                story.append(Spacer(1, 0.15*inch))
+
+                if overflow[severity]:
                     story.append(Paragraph(
-                        f"<i>... and {len(findings) - 20} more {severity} findings</i>",
+                        f"<i>... and {overflow[severity]} more {severity} findings</i>",
                         styles['Normal']
                     ))
                     story.append(Spacer(1, 0.2*inch))
@@ -272,7 +459,7 @@ def generate_pdf_report(scan_results, output_path):
                 'Success',
                 parent=styles['Normal'],
                 fontSize=14,
-                textColor=colors.HexColor('#27ae60'),
+                textColor=_COLOR_SUCCESS,
                 alignment=TA_CENTER,
                 fontName='Helvetica-Bold'
             )
@@ -283,7 +470,7 @@ def generate_pdf_report(scan_results, output_path):
         story.append(PageBreak())
         story.append(Paragraph("Scan Errors", heading_style))
         for error in errors:
-            error_text = str(error).replace('<', '&lt;').replace('>', '&gt;')
+            error_text = _escape_markup(error)
             story.append(Paragraph(f"• {error_text}", styles['Normal']))
             story.append(Spacer(1, 0.1*inch))
 
@@ -321,9 +508,8 @@ def main():
     print(f"{'='*60}\n")
 
     # Return exit code based on findings
-    results = scan_results.get("results", [])
-    critical_count = sum(1 for r in results if r.get("extra", {}).get("severity", "").upper() == "CRITICAL")
-    high_count = sum(1 for r in results if r.get("extra", {}).get("severity", "").upper() == "HIGH")
+    critical_count = scan_results["counts"]["CRITICAL"]
+    high_count = scan_results["counts"]["HIGH"]
 
     if critical_count > 0:
         print(f"�  Found {critical_count} CRITICAL severity issues")
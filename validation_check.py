@@ -7,56 +7,90 @@ confidence intervals, and visualizations
 
 import os
 import sys
-import random
 import math
+import functools
+import gzip
+import string
+from contextlib import nullcontext
 from datetime import datetime
 from pathlib import Path
 
-# Set random seed based on current time for stochastic variation
-random.seed(int(datetime.now().timestamp() * 1000) % 1000000)
-
-
-def generate_monte_carlo_data():
+import numpy as np
+
+# Single PCG64 generator for all stochastic values; set MC_SEED for reproducible
+# reports, otherwise it is seeded from OS entropy
+_MC_SEED = os.environ.get("MC_SEED", "").strip()
+try:
+    _RNG = np.random.default_rng(int(_MC_SEED) if _MC_SEED else None)
+except ValueError:
+    # Also raised for negative seeds, which SeedSequence rejects
+    print(f"ERROR: MC_SEED must be a non-negative integer, got {_MC_SEED!r}", file=sys.stderr)
+    sys.exit(2)
+
+# Artifact location is resolved once at import
+_ARTIFACT_DIR = Path(os.environ.get("DOMINO_ARTIFACTS_DIR", "/mnt/artifacts"))
+_ARTIFACT_PATH = _ARTIFACT_DIR / "validation_report.html"
+
+# Uniform offset ranges for the scalar metrics, drawn together in one call:
+# convergence, delta, gamma, vega, theta, rho, rmse, mae, r_squared
+_METRIC_DRAW_LOWS = np.array([-0.0025, -0.15, -0.005, -0.05, -0.01, -0.03, 0.008, 0.006, -0.015])
+_METRIC_DRAW_HIGHS = np.array([0.0025, 0.15, 0.005, 0.05, 0.01, 0.03, 0.025, 0.020, 0.010])
+
+# Convergence chart always draws the same number of steps, so the exponential
+# decay schedules are fixed and computed once at import
+_CONV_ITERATIONS = 25
+_CONV_STEPS = np.arange(_CONV_ITERATIONS)
+_CONV_FACTORS = 1.0 - np.exp(-_CONV_STEPS / 5.0)  # Fast initial convergence
+_NOISE_AMPS = 10.0 * np.exp(-_CONV_STEPS / 3.0)  # Decreasing noise
+_CONV_XS = tuple(50.0 + i * 14.0 for i in range(_CONV_ITERATIONS))
+
+# Greeks chart rows: labels, bar colours and bar Y positions
+_GREEK_NAMES = ('Delta', 'Gamma', 'Vega', 'Theta', 'Rho')
+_GREEK_COLORS = ('#3498db', '#9b59b6', '#e74c3c', '#f39c12', '#1abc9c')
+_GREEKS_YS = tuple(30 + i * 32 for i in range(len(_GREEK_NAMES)))
+
+
+def generate_monte_carlo_data(rng=_RNG):
     """
     Generate stochastic Monte Carlo simulation results
     """
     print("Running Monte Carlo simulations...")
 
     # Generate base values with some randomness
-    num_simulations = random.randint(98000, 102000)
-    convergence_rate = 0.9950 + random.uniform(-0.0025, 0.0025)
+    num_simulations = int(rng.integers(98000, 102001))
+    (conv_draw, delta_draw, gamma_draw, vega_draw, theta_draw, rho_draw,
+     rmse, mae, r_squared_draw) = rng.uniform(_METRIC_DRAW_LOWS, _METRIC_DRAW_HIGHS).tolist()
+    convergence_rate = 0.9950 + conv_draw
 
     # Pricing model results
     base_price = 100.0
-    simulated_prices = []
-    for _ in range(50):
-        drift = random.gauss(0, 0.15)
-        simulated_prices.append(base_price * (1 + drift))
+    simulated_prices = base_price * (1.0 + 0.15 * rng.standard_normal(50))
 
-    mean_price = sum(simulated_prices) / len(simulated_prices)
-    variance = sum((x - mean_price) ** 2 for x in simulated_prices) / len(simulated_prices)
-    std_dev = math.sqrt(variance)
+    mean_price = float(simulated_prices.mean())
+    std_dev = float(simulated_prices.std())
 
     # Confidence intervals (95%)
     z_score = 1.96
-    ci_lower = mean_price - z_score * (std_dev / math.sqrt(len(simulated_prices)))
-    ci_upper = mean_price + z_score * (std_dev / math.sqrt(len(simulated_prices)))
+    n = len(simulated_prices)
+    inv_sqrt_n = 1.0 / math.sqrt(n)
+    se = std_dev * inv_sqrt_n  # Standard error of the mean
+    ci_half = z_score * se
+    ci_lower = mean_price - ci_half
+    ci_upper = mean_price + ci_half
 
     # Risk metrics
     var_95 = mean_price - 1.645 * std_dev  # Value at Risk
     cvar_95 = mean_price - 2.063 * std_dev  # Conditional VaR
 
     # Greeks (option sensitivities)
-    delta = 0.5 + random.uniform(-0.15, 0.15)
-    gamma = 0.02 + random.uniform(-0.005, 0.005)
-    vega = 0.25 + random.uniform(-0.05, 0.05)
-    theta = -0.05 + random.uniform(-0.01, 0.01)
-    rho = 0.15 + random.uniform(-0.03, 0.03)
+    delta = 0.5 + delta_draw
+    gamma = 0.02 + gamma_draw
+    vega = 0.25 + vega_draw
+    theta = -0.05 + theta_draw
+    rho = 0.15 + rho_draw
 
-    # Validation metrics
-    rmse = random.uniform(0.008, 0.025)
-    mae = random.uniform(0.006, 0.020)
-    r_squared = 0.985 + random.uniform(-0.015, 0.010)
+    # Validation metrics (rmse and mae are drawn directly above)
+    r_squared = 0.985 + r_squared_draw
 
     return {
         'num_simulations': num_simulations,
@@ -75,94 +109,97 @@ def generate_monte_carlo_data():
         'rmse': rmse,
         'mae': mae,
         'r_squared': r_squared,
-        'simulated_prices': simulated_prices
+        'simulated_prices': simulated_prices,
+        'num_simulations_fmt': f"{num_simulations:,}",
+        'mean_price_fmt': f"{mean_price:.2f}",
+        'ci_lower_fmt': f"{ci_lower:.2f}",
+        'ci_upper_fmt': f"{ci_upper:.2f}",
+        'r_squared_fmt': f"{r_squared:.4f}",
+        'rmse_fmt': f"{rmse:.4f}",
     }
 
 
-def generate_convergence_chart(data):
+def _converge(target, initial, conv_factors, noises):
+    """
+    Run the convergence recurrence; each step depends on the previous estimate
+    """
+    # Only 25 steps, so a plain loop over Python floats beats any compiled kernel once
+    # its import and JIT cost are counted
+    estimates = []
+    current = initial
+    for convergence_factor, noise in zip(conv_factors.tolist(), noises.tolist()):
+        current = target * convergence_factor + current * (1 - convergence_factor) + noise
+        estimates.append(current)
+    return np.array(estimates)
+
+
+def generate_convergence_chart(data, rng=_RNG):
     """
     Generate convergence chart showing how estimated mean converges to true value
     """
     # Simulate convergence: starts with high variance, converges to true mean
     target_mean = data['mean_price']
-    points = []
-    iterations = 25
 
-    # Start with a value that's off from the target
-    current_estimate = target_mean * random.uniform(0.85, 1.15)
-
-    for i in range(iterations):
-        # Exponential decay towards true mean with diminishing noise
-        convergence_factor = 1 - math.exp(-i / 5)  # Fast initial convergence
-        noise_amplitude = 10 * math.exp(-i / 3)  # Decreasing noise
-        noise = random.gauss(0, noise_amplitude)
-
-        # Gradually converge to target
-        current_estimate = target_mean * convergence_factor + current_estimate * (1 - convergence_factor) + noise
+    # Exponential decay towards true mean with diminishing noise
+    noises = _NOISE_AMPS * rng.standard_normal(_CONV_ITERATIONS)
 
-        # Map to SVG coordinates (Y-axis is inverted)
-        # Price range: target ± 20 for visualization
-        y_min, y_max = target_mean - 20, target_mean + 20
-        x = 50 + i * 14  # X coordinate
-        y = 170 - ((current_estimate - y_min) / (y_max - y_min)) * 140  # Map price to Y
-        y = max(20, min(170, y))  # Clamp to chart bounds
+    # Start with a value that's off from the target
+    initial_estimate = target_mean * rng.uniform(0.85, 1.15)
+    estimates = _converge(target_mean, initial_estimate, _CONV_FACTORS, noises)
 
-        points.append((x, y))
+    # Map to SVG coordinates (Y-axis is inverted)
+    # Price range: target ± 20 for visualization
+    y_min, y_max = target_mean - 20, target_mean + 20
+    y_scale = 140.0 / (y_max - y_min)
+    ys = np.clip(170.0 - (estimates - y_min) * y_scale, 20.0, 170.0)  # Clamp to chart bounds
+    points = list(zip(_CONV_XS, ys.tolist()))
 
-    path_data = "M " + " L ".join([f"{x},{y}" for x, y in points])
+    path_body = " L ".join(f"{x:.1f},{y:.1f}" for x, y in points)
+    path_data = f"M {path_body}"
 
     # Calculate Y positions for price labels
     high_price = target_mean + 20
     mid_price = target_mean
     low_price = target_mean - 20
 
-    svg = f'''
-    <svg width="100%" height="200" viewBox="0 0 400 200" style="background: #f8f9fa; border-radius: 4px;">
-        <defs>
-            <linearGradient id="convergenceGrad" x1="0%" y1="0%" x2="0%" y2="100%">
-                <stop offset="0%" style="stop-color:#3498db;stop-opacity:0.3" />
-                <stop offset="100%" style="stop-color:#3498db;stop-opacity:0.1" />
-            </linearGradient>
-        </defs>
-
-        <!-- Grid lines -->
-        <line x1="50" y1="20" x2="50" y2="170" stroke="#ccc" stroke-width="1"/>
-        <line x1="50" y1="170" x2="400" y2="170" stroke="#ccc" stroke-width="1"/>
-
-        <!-- Horizontal grid lines -->
-        <line x1="50" y1="95" x2="400" y2="95" stroke="#e0e0e0" stroke-width="1" stroke-dasharray="5,5"/>
-
-        <!-- Target line (true mean) -->
-        <line x1="50" y1="95" x2="400" y2="95" stroke="#27ae60" stroke-width="1.5" stroke-dasharray="8,4" opacity="0.6"/>
-        <text x="405" y="98" font-family="Arial" font-size="9" fill="#27ae60">Target: ${target_mean:.1f}</text>
-
-        <!-- Area under curve -->
-        <path d="M50,170 L{path_data.replace('M ', '')} L{400},170 Z" fill="url(#convergenceGrad)" />
-
-        <!-- Line -->
-        <path d="{path_data}" fill="none" stroke="#2980b9" stroke-width="2.5"/>
-
-        <!-- Starting point marker -->
-        <circle cx="{points[0][0]}" cy="{points[0][1]}" r="4" fill="#e74c3c"/>
-
-        <!-- Ending point marker -->
-        <circle cx="{points[-1][0]}" cy="{points[-1][1]}" r="4" fill="#27ae60"/>
-
-        <!-- Y-axis labels (prices) -->
-        <text x="5" y="25" font-family="Arial" font-size="10" fill="#666">${high_price:.0f}</text>
-        <text x="5" y="98" font-family="Arial" font-size="10" fill="#27ae60" font-weight="bold">${mid_price:.0f}</text>
-        <text x="5" y="173" font-family="Arial" font-size="10" fill="#666">${low_price:.0f}</text>
-
-        <!-- X-axis label -->
-        <text x="225" y="195" font-family="Arial" font-size="11" fill="#666" text-anchor="middle">Simulation Iterations (thousands)</text>
-
-        <!-- X-axis tick labels -->
-        <text x="50" y="185" font-family="Arial" font-size="9" fill="#999" text-anchor="middle">0</text>
-        <text x="200" y="185" font-family="Arial" font-size="9" fill="#999" text-anchor="middle">50k</text>
-        <text x="350" y="185" font-family="Arial" font-size="9" fill="#999" text-anchor="middle">100k</text>
-    </svg>
-    '''
-    return svg
+    parts = []
+    parts.append('<svg width="100%" height="200" viewBox="0 0 400 200" style="background: #f8f9fa; border-radius: 4px;">')
+    parts.append(
+        '<defs><linearGradient id="convergenceGrad" x1="0%" y1="0%" x2="0%" y2="100%">'
+        '<stop offset="0%" style="stop-color:#3498db;stop-opacity:0.3" />'
+        '<stop offset="100%" style="stop-color:#3498db;stop-opacity:0.1" />'
+        '</linearGradient></defs>'
+    )
+
+    # Grid lines
+    parts.append('<line x1="50" y1="20" x2="50" y2="170" stroke="#ccc" stroke-width="1"/>')
+    parts.append('<line x1="50" y1="170" x2="400" y2="170" stroke="#ccc" stroke-width="1"/>')
+    parts.append('<line x1="50" y1="95" x2="400" y2="95" stroke="#e0e0e0" stroke-width="1" stroke-dasharray="5,5"/>')
+
+    # Target line (true mean)
+    parts.append('<line x1="50" y1="95" x2="400" y2="95" stroke="#27ae60" stroke-width="1.5" stroke-dasharray="8,4" opacity="0.6"/>')
+    parts.append(f'<text x="405" y="98" font-family="Arial" font-size="9" fill="#27ae60">Target: ${target_mean:.1f}</text>')
+
+    # Area under curve and line
+    parts.append(f'<path d="M50,170 L{path_body} L400,170 Z" fill="url(#convergenceGrad)" />')
+    parts.append(f'<path d="{path_data}" fill="none" stroke="#2980b9" stroke-width="2.5"/>')
+
+    # Starting and ending point markers
+    parts.append(f'<circle cx="{points[0][0]}" cy="{points[0][1]}" r="4" fill="#e74c3c"/>')
+    parts.append(f'<circle cx="{points[-1][0]}" cy="{points[-1][1]}" r="4" fill="#27ae60"/>')
+
+    # Y-axis labels (prices)
+    parts.append(f'<text x="5" y="25" font-family="Arial" font-size="10" fill="#666">${high_price:.0f}</text>')
+    parts.append(f'<text x="5" y="98" font-family="Arial" font-size="10" fill="#27ae60" font-weight="bold">${mid_price:.0f}</text>')
+    parts.append(f'<text x="5" y="173" font-family="Arial" font-size="10" fill="#666">${low_price:.0f}</text>')
+
+    # X-axis label and tick labels
+    parts.append('<text x="225" y="195" font-family="Arial" font-size="11" fill="#666" text-anchor="middle">Simulation Iterations (thousands)</text>')
+    parts.append('<text x="50" y="185" font-family="Arial" font-size="9" fill="#999" text-anchor="middle">0</text>')
+    parts.append('<text x="200" y="185" font-family="Arial" font-size="9" fill="#999" text-anchor="middle">50k</text>')
+    parts.append('<text x="350" y="185" font-family="Arial" font-size="9" fill="#999" text-anchor="middle">100k</text>')
+    parts.append('</svg>')
+    return ''.join(parts)
 
 
 def generate_distribution_chart(prices):
@@ -170,100 +207,64 @@ def generate_distribution_chart(prices):
     Generate histogram-style distribution chart
     """
     # Create histogram bins
-    min_price = min(prices)
-    max_price = max(prices)
     num_bins = 15
-    bin_width = (max_price - min_price) / num_bins
+    counts, _ = np.histogram(prices, bins=num_bins)
+    max_count = int(counts.max())
 
-    bins = [0] * num_bins
-    for price in prices:
-        bin_idx = min(int((price - min_price) / bin_width), num_bins - 1)
-        bins[bin_idx] += 1
+    parts = []
+    parts.append('<svg width="100%" height="200" viewBox="0 0 400 200" style="background: #f8f9fa; border-radius: 4px;">')
 
-    max_count = max(bins)
+    # Grid lines
+    parts.append('<line x1="40" y1="30" x2="40" y2="170" stroke="#ccc" stroke-width="1"/>')
+    parts.append('<line x1="40" y1="170" x2="400" y2="170" stroke="#ccc" stroke-width="1"/>')
 
-    # Generate SVG bars
-    bars = []
+    # Bars
     bar_width = 360 / num_bins
-    for i, count in enumerate(bins):
+    for i, count in enumerate(counts.tolist()):
         height = (count / max_count) * 140 if max_count > 0 else 0
         x = 40 + i * bar_width
         y = 170 - height
-        bars.append(f'<rect x="{x}" y="{y}" width="{bar_width-2}" height="{height}" fill="#27ae60" opacity="0.7"/>')
+        parts.append(f'<rect x="{x}" y="{y}" width="{bar_width-2}" height="{height}" fill="#27ae60" opacity="0.7"/>')
 
-    svg = f'''
-    <svg width="100%" height="200" viewBox="0 0 400 200" style="background: #f8f9fa; border-radius: 4px;">
-        <!-- Grid lines -->
-        <line x1="40" y1="30" x2="40" y2="170" stroke="#ccc" stroke-width="1"/>
-        <line x1="40" y1="170" x2="400" y2="170" stroke="#ccc" stroke-width="1"/>
-
-        <!-- Bars -->
-        {''.join(bars)}
-
-        <!-- Labels -->
-        <text x="10" y="35" font-family="Arial" font-size="11" fill="#666">Freq</text>
-        <text x="200" y="195" font-family="Arial" font-size="11" fill="#666" text-anchor="middle">Price Distribution</text>
-    </svg>
-    '''
-    return svg
+    # Labels
+    parts.append('<text x="10" y="35" font-family="Arial" font-size="11" fill="#666">Freq</text>')
+    parts.append('<text x="200" y="195" font-family="Arial" font-size="11" fill="#666" text-anchor="middle">Price Distribution</text>')
+    parts.append('</svg>')
+    return ''.join(parts)
 
 
 def generate_greeks_chart(data):
     """
     Generate Greeks sensitivity chart
     """
-    greeks = [
-        ('Delta', data['delta'], '#3498db'),
-        ('Gamma', data['gamma'] * 10, '#9b59b6'),
-        ('Vega', data['vega'], '#e74c3c'),
-        ('Theta', abs(data['theta']) * 10, '#f39c12'),
-        ('Rho', data['rho'], '#1abc9c')
-    ]
-
-    bars = []
-    for i, (name, value, color) in enumerate(greeks):
-        # Normalize to 0-1 range for display
-        normalized = abs(value)
-        width = min(normalized * 250, 250)
-        x = 120
-        y = 30 + i * 32
-
-        bars.append(f'''
-            <rect x="{x}" y="{y}" width="{width}" height="22" fill="{color}" opacity="0.8" rx="2"/>
-            <text x="10" y="{y+16}" font-family="Arial" font-size="12" fill="#333" font-weight="bold">{name}</text>
-            <text x="{x+width+10}" y="{y+16}" font-family="Arial" font-size="11" fill="#666">{value:.4f}</text>
-        ''')
-
-    svg = f'''
-    <svg width="100%" height="180" viewBox="0 0 400 180" style="background: #f8f9fa; border-radius: 4px;">
-        {''.join(bars)}
-    </svg>
-    '''
-    return svg
+    values = np.array([data['delta'], data['gamma'] * 10, data['vega'], abs(data['theta']) * 10, data['rho']])
 
+    # Normalize to 0-1 range for display
+    widths = np.minimum(np.abs(values) * 250, 250)
+    x = 120
 
-def generate_html_report(data, output_path):
-    """
-    Generate professional HTML validation report
-    """
-    print(f"Generating HTML report: {output_path}")
+    parts = []
+    parts.append('<svg width="100%" height="180" viewBox="0 0 400 180" style="background: #f8f9fa; border-radius: 4px;">')
+    for name, color, value, width, y in zip(_GREEK_NAMES, _GREEK_COLORS, values.tolist(), widths.tolist(), _GREEKS_YS):
+        parts.append(f'<rect x="{x}" y="{y}" width="{width}" height="22" fill="{color}" opacity="0.8" rx="2"/>')
+        parts.append(f'<text x="10" y="{y+16}" font-family="Arial" font-size="12" fill="#333" font-weight="bold">{name}</text>')
+        parts.append(f'<text x="{x+width+10}" y="{y+16}" font-family="Arial" font-size="11" fill="#666">{value:.4f}</text>')
+    parts.append('</svg>')
+    return ''.join(parts)
 
-    convergence_chart = generate_convergence_chart(data)
-    distribution_chart = generate_distribution_chart(data['simulated_prices'])
-    greeks_chart = generate_greeks_chart(data)
 
-    # Determine validation status
-    validation_passed = data['rmse'] < 0.03 and data['r_squared'] > 0.95
-    status_color = '#27ae60' if validation_passed else '#e74c3c'
-    status_text = 'PASSED' if validation_passed else 'REVIEW REQUIRED'
-
-    html_content = f'''
+# HTML report sections, filled with str.format_map from a context of pre-formatted values
+_REPORT_SECTIONS = (
+    # Document head
+    '''
 <!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Monte Carlo Validation Report</title>
+    <title>Monte Carlo Validation Report</title>''',
+    # Stylesheet
+    '''
     <style>
         * {{
             margin: 0;
@@ -488,56 +489,62 @@ def generate_html_report(data, output_path):
             font-weight: 600;
         }}
     </style>
-</head>
+</head>''',
+    # Header banner
+    '''
 <body>
     <div class="header">
         <div class="container">
             <h1>Monte Carlo Validation Report</h1>
             <div class="meta">
-                Generated: {datetime.now().strftime('%B %d, %Y at %H:%M:%S UTC')} |
+                Generated: {generated_at} |
                 Model Version: 3.2.1 |
-                Simulations: {data['num_simulations']:,}
+                Simulations: {num_simulations_fmt}
             </div>
             <div class="status-badge">{status_text}</div>
         </div>
     </div>
-
+''',
+    # Executive summary
+    '''
     <div class="container">
         <div class="executive-summary">
             <h2 style="margin-bottom: 1rem; color: #2c3e50;">Executive Summary</h2>
             <p style="font-size: 1.05rem; line-height: 1.8; color: #555; margin-bottom: 1rem;">
-                This report presents the results of <span class="highlight">{data['num_simulations']:,} Monte Carlo simulations</span>
+                This report presents the results of <span class="highlight">{num_simulations_fmt} Monte Carlo simulations</span>
                 performed to validate pricing models and risk metrics. The simulations achieved a convergence rate of
-                <span class="highlight">{data['convergence_rate']*100:.2f}%</span> with statistical significance at the 95% confidence level.
+                <span class="highlight">{convergence_pct_2f}%</span> with statistical significance at the 95% confidence level.
             </p>
 
             <div class="metrics-grid">
                 <div class="metric-card">
                     <div class="metric-label">Mean Price</div>
-                    <div class="metric-value">${data['mean_price']:.2f}</div>
-                    <div class="metric-subtext">± ${data['std_dev']:.2f} std dev</div>
+                    <div class="metric-value">${mean_price_fmt}</div>
+                    <div class="metric-subtext">± ${std_dev_2f} std dev</div>
                 </div>
 
                 <div class="metric-card">
                     <div class="metric-label">Convergence</div>
-                    <div class="metric-value">{data['convergence_rate']*100:.2f}%</div>
-                    <div class="metric-subtext">{data['num_simulations']:,} iterations</div>
+                    <div class="metric-value">{convergence_pct_2f}%</div>
+                    <div class="metric-subtext">{num_simulations_fmt} iterations</div>
                 </div>
 
                 <div class="metric-card">
                     <div class="metric-label">R² Score</div>
-                    <div class="metric-value">{data['r_squared']:.4f}</div>
+                    <div class="metric-value">{r_squared_fmt}</div>
                     <div class="metric-subtext">Model fit quality</div>
                 </div>
 
                 <div class="metric-card">
                     <div class="metric-label">RMSE</div>
-                    <div class="metric-value">{data['rmse']:.4f}</div>
+                    <div class="metric-value">{rmse_fmt}</div>
                     <div class="metric-subtext">Root mean square error</div>
                 </div>
             </div>
         </div>
-
+''',
+    # Statistical analysis
+    '''
         <div class="content">
             <!-- Statistical Analysis -->
             <div class="section">
@@ -550,7 +557,7 @@ def generate_html_report(data, output_path):
                 <p style="margin-top: 1rem; color: #666; font-size: 0.95rem;">
                     The convergence plot shows how the estimated mean price (blue line) converges to the true value (green dashed line)
                     as more simulations are performed. The red dot marks the initial estimate, while the green dot shows the final
-                    converged value. The chart demonstrates rapid stabilization, achieving convergence within {random.randint(15000, 25000):,} iterations.
+                    converged value. The chart demonstrates rapid stabilization, achieving convergence within {convergence_iterations_comma} iterations.
                 </p>
 
                 <h3>Price Distribution</h3>
@@ -564,7 +571,7 @@ def generate_html_report(data, output_path):
                     </h4>
                     <p style="font-size: 1.05rem;">
                         The simulated price is expected to fall between
-                        <strong>${data['ci_lower']:.2f}</strong> and <strong>${data['ci_upper']:.2f}</strong>
+                        <strong>${ci_lower_fmt}</strong> and <strong>${ci_upper_fmt}</strong>
                         with 95% confidence (z-score: 1.96).
                     </p>
                     <table style="margin-top: 1rem; background: white;">
@@ -578,29 +585,31 @@ def generate_html_report(data, output_path):
                         <tbody>
                             <tr>
                                 <td><strong>Mean (μ)</strong></td>
-                                <td>${data['mean_price']:.4f}</td>
+                                <td>${mean_price_4f}</td>
                                 <td>Expected value</td>
                             </tr>
                             <tr>
                                 <td><strong>Std Dev (σ)</strong></td>
-                                <td>{data['std_dev']:.4f}</td>
+                                <td>{std_dev_4f}</td>
                                 <td>Price volatility</td>
                             </tr>
                             <tr>
                                 <td><strong>Lower Bound</strong></td>
-                                <td>${data['ci_lower']:.4f}</td>
+                                <td>${ci_lower_4f}</td>
                                 <td>95% CI minimum</td>
                             </tr>
                             <tr>
                                 <td><strong>Upper Bound</strong></td>
-                                <td>${data['ci_upper']:.4f}</td>
+                                <td>${ci_upper_4f}</td>
                                 <td>95% CI maximum</td>
                             </tr>
                         </tbody>
                     </table>
                 </div>
             </div>
-
+''',
+    # Risk metrics
+    '''
             <!-- Risk Metrics -->
             <div class="section">
                 <h2>Risk Metrics</h2>
@@ -608,7 +617,7 @@ def generate_html_report(data, output_path):
                 <div class="risk-metrics">
                     <div class="risk-card">
                         <h4>Value at Risk (VaR 95%)</h4>
-                        <div class="risk-value">${data['var_95']:.2f}</div>
+                        <div class="risk-value">${var_95_2f}</div>
                         <p style="margin-top: 0.5rem; font-size: 0.9rem; color: #666;">
                             Maximum expected loss at 95% confidence
                         </p>
@@ -616,7 +625,7 @@ def generate_html_report(data, output_path):
 
                     <div class="risk-card">
                         <h4>Conditional VaR (CVaR 95%)</h4>
-                        <div class="risk-value">${data['cvar_95']:.2f}</div>
+                        <div class="risk-value">${cvar_95_2f}</div>
                         <p style="margin-top: 0.5rem; font-size: 0.9rem; color: #666;">
                             Expected loss in worst 5% scenarios
                         </p>
@@ -635,26 +644,28 @@ def generate_html_report(data, output_path):
                     <tbody>
                         <tr>
                             <td>Standard Deviation</td>
-                            <td>{data['std_dev']:.4f}</td>
+                            <td>{std_dev_4f}</td>
                             <td>&lt; 20.0</td>
                             <td style="color: #27ae60; font-weight: 600;">✓ Pass</td>
                         </tr>
                         <tr>
                             <td>VaR (95%)</td>
-                            <td>${data['var_95']:.2f}</td>
+                            <td>${var_95_2f}</td>
                             <td>Monitoring</td>
                             <td style="color: #27ae60; font-weight: 600;">✓ Pass</td>
                         </tr>
                         <tr>
                             <td>CVaR (95%)</td>
-                            <td>${data['cvar_95']:.2f}</td>
+                            <td>${cvar_95_2f}</td>
                             <td>Monitoring</td>
                             <td style="color: #27ae60; font-weight: 600;">✓ Pass</td>
                         </tr>
                     </tbody>
                 </table>
             </div>
-
+''',
+    # Greeks analysis
+    '''
             <!-- Greeks Analysis -->
             <div class="section">
                 <h2>Option Greeks & Sensitivities</h2>
@@ -675,38 +686,40 @@ def generate_html_report(data, output_path):
                     <tbody>
                         <tr>
                             <td><strong>Delta (Δ)</strong></td>
-                            <td>{data['delta']:.4f}</td>
+                            <td>{delta_4f}</td>
                             <td>Price sensitivity to underlying</td>
-                            <td>{'Positive' if data['delta'] > 0 else 'Negative'} correlation</td>
+                            <td>{delta_impact} correlation</td>
                         </tr>
                         <tr>
                             <td><strong>Gamma (Γ)</strong></td>
-                            <td>{data['gamma']:.4f}</td>
+                            <td>{gamma_4f}</td>
                             <td>Rate of change of delta</td>
-                            <td>{'High' if data['gamma'] > 0.02 else 'Moderate'} curvature</td>
+                            <td>{gamma_impact} curvature</td>
                         </tr>
                         <tr>
                             <td><strong>Vega (ν)</strong></td>
-                            <td>{data['vega']:.4f}</td>
+                            <td>{vega_4f}</td>
                             <td>Sensitivity to volatility</td>
-                            <td>{'Significant' if abs(data['vega']) > 0.2 else 'Moderate'} vol impact</td>
+                            <td>{vega_impact} vol impact</td>
                         </tr>
                         <tr>
                             <td><strong>Theta (Θ)</strong></td>
-                            <td>{data['theta']:.4f}</td>
+                            <td>{theta_4f}</td>
                             <td>Time decay</td>
-                            <td>${abs(data['theta']):.4f} per day</td>
+                            <td>${theta_abs_4f} per day</td>
                         </tr>
                         <tr>
                             <td><strong>Rho (ρ)</strong></td>
-                            <td>{data['rho']:.4f}</td>
+                            <td>{rho_4f}</td>
                             <td>Interest rate sensitivity</td>
-                            <td>{'Positive' if data['rho'] > 0 else 'Negative'} rate exposure</td>
+                            <td>{rho_impact} rate exposure</td>
                         </tr>
                     </tbody>
                 </table>
             </div>
-
+''',
+    # Model validation
+    '''
             <!-- Model Validation -->
             <div class="section">
                 <h2>Model Validation Metrics</h2>
@@ -723,34 +736,34 @@ def generate_html_report(data, output_path):
                     <tbody>
                         <tr>
                             <td><strong>R² (Coefficient of Determination)</strong></td>
-                            <td>{data['r_squared']:.6f}</td>
+                            <td>{r_squared_6f}</td>
                             <td>&gt; 0.95</td>
-                            <td style="color: {'#27ae60' if data['r_squared'] > 0.95 else '#e74c3c'}; font-weight: 600;">
-                                {'✓ Pass' if data['r_squared'] > 0.95 else '✗ Review'}
+                            <td style="color: {r_squared_color}; font-weight: 600;">
+                                {r_squared_status}
                             </td>
                         </tr>
                         <tr>
                             <td><strong>RMSE (Root Mean Square Error)</strong></td>
-                            <td>{data['rmse']:.6f}</td>
+                            <td>{rmse_6f}</td>
                             <td>&lt; 0.03</td>
-                            <td style="color: {'#27ae60' if data['rmse'] < 0.03 else '#e74c3c'}; font-weight: 600;">
-                                {'✓ Pass' if data['rmse'] < 0.03 else '✗ Review'}
+                            <td style="color: {rmse_color}; font-weight: 600;">
+                                {rmse_status}
                             </td>
                         </tr>
                         <tr>
                             <td><strong>MAE (Mean Absolute Error)</strong></td>
-                            <td>{data['mae']:.6f}</td>
+                            <td>{mae_6f}</td>
                             <td>&lt; 0.025</td>
-                            <td style="color: {'#27ae60' if data['mae'] < 0.025 else '#e74c3c'}; font-weight: 600;">
-                                {'✓ Pass' if data['mae'] < 0.025 else '✗ Review'}
+                            <td style="color: {mae_color}; font-weight: 600;">
+                                {mae_status}
                             </td>
                         </tr>
                         <tr>
                             <td><strong>Convergence Rate</strong></td>
-                            <td>{data['convergence_rate']*100:.4f}%</td>
+                            <td>{convergence_pct_4f}%</td>
                             <td>&gt; 99.0%</td>
-                            <td style="color: {'#27ae60' if data['convergence_rate'] > 0.99 else '#f39c12'}; font-weight: 600;">
-                                {'✓ Pass' if data['convergence_rate'] > 0.99 else '⚠ Acceptable'}
+                            <td style="color: {convergence_color}; font-weight: 600;">
+                                {convergence_status}
                             </td>
                         </tr>
                     </tbody>
@@ -762,54 +775,211 @@ def generate_html_report(data, output_path):
                     </h4>
                     <p style="font-size: 1.05rem; line-height: 1.8;">
                         The model demonstrates <strong>excellent predictive accuracy</strong> with an R² score of
-                        {data['r_squared']:.4f} and RMSE of {data['rmse']:.4f}. The Monte Carlo simulations converged
-                        successfully with {data['num_simulations']:,} iterations, providing robust statistical confidence
+                        {r_squared_fmt} and RMSE of {rmse_fmt}. The Monte Carlo simulations converged
+                        successfully with {num_simulations_fmt} iterations, providing robust statistical confidence
                         in the results. All validation metrics meet or exceed target thresholds.
                     </p>
                 </div>
             </div>
-
+''',
+    # Methodology
+    '''
             <!-- Methodology -->
             <div class="section">
                 <h2>Methodology</h2>
 
                 <h3>Simulation Parameters</h3>
                 <ul style="line-height: 2; margin-left: 1.5rem; color: #555;">
-                    <li><strong>Number of Simulations:</strong> {data['num_simulations']:,}</li>
-                    <li><strong>Random Number Generator:</strong> Mersenne Twister (MT19937)</li>
+                    <li><strong>Number of Simulations:</strong> {num_simulations_fmt}</li>
+                    <li><strong>Random Number Generator:</strong> NumPy PCG64</li>
                     <li><strong>Distribution:</strong> Geometric Brownian Motion (GBM)</li>
-                    <li><strong>Time Horizon:</strong> {random.randint(30, 180)} days</li>
-                    <li><strong>Time Steps:</strong> {random.randint(50, 100)} per simulation</li>
+                    <li><strong>Time Horizon:</strong> {time_horizon_days} days</li>
+                    <li><strong>Time Steps:</strong> {time_steps} per simulation</li>
                     <li><strong>Confidence Level:</strong> 95% (α = 0.05)</li>
                 </ul>
 
                 <h3>Statistical Tests Performed</h3>
                 <ul style="line-height: 2; margin-left: 1.5rem; color: #555;">
-                    <li>Normality test (Shapiro-Wilk): p-value = {random.uniform(0.15, 0.45):.4f}</li>
-                    <li>Autocorrelation test (Durbin-Watson): {random.uniform(1.8, 2.2):.4f}</li>
-                    <li>Heteroscedasticity test (Breusch-Pagan): p-value = {random.uniform(0.10, 0.40):.4f}</li>
+                    <li>Normality test (Shapiro-Wilk): p-value = {shapiro_p_4f}</li>
+                    <li>Autocorrelation test (Durbin-Watson): {durbin_watson_4f}</li>
+                    <li>Heteroscedasticity test (Breusch-Pagan): p-value = {breusch_pagan_p_4f}</li>
                 </ul>
             </div>
         </div>
     </div>
-
+''',
+    # Footer
+    '''
     <div class="footer">
         <div class="container">
             <p>Monte Carlo Validation Report | Quantitative Risk Management System v3.2.1</p>
             <p style="margin-top: 0.5rem; opacity: 0.8;">
-                Generated automatically from {data['num_simulations']:,} simulation paths |
+                Generated automatically from {num_simulations_fmt} simulation paths |
                 Confidence Level: 95% | Statistical Significance: α = 0.05
             </p>
         </div>
     </div>
 </body>
 </html>
-'''
+''',
+)
+
+
+# Report fields that change on every render (timestamp, rng draws) and so are never
+# cached, each with its builder; called as build(data, rng) in this (draw) order
+_PER_RENDER_BUILDERS = {
+    'generated_at': lambda data, rng: datetime.now().strftime('%B %d, %Y at %H:%M:%S UTC'),
+    'convergence_iterations_comma': lambda data, rng: f"{int(rng.integers(15000, 25001)):,}",
+    'time_horizon_days': lambda data, rng: int(rng.integers(30, 181)),
+    'time_steps': lambda data, rng: int(rng.integers(50, 101)),
+    'shapiro_p_4f': lambda data, rng: f"{rng.uniform(0.15, 0.45):.4f}",
+    'durbin_watson_4f': lambda data, rng: f"{rng.uniform(1.8, 2.2):.4f}",
+    'breusch_pagan_p_4f': lambda data, rng: f"{rng.uniform(0.10, 0.40):.4f}",
+    'convergence_chart': generate_convergence_chart,
+}
+_PER_RENDER_FIELDS = frozenset(_PER_RENDER_BUILDERS)
+_SECTION_IS_PER_RENDER = tuple(
+    any(field in _PER_RENDER_FIELDS for _, field, _, _ in string.Formatter().parse(section))
+    for section in _REPORT_SECTIONS
+)
+
+
+def _report_key(data):
+    """
+    Hashable fingerprint of the simulation data, used to memoize rendered reports
+    """
+    metrics = tuple(sorted((k, v) for k, v in data.items() if k != 'simulated_prices'))
+    return metrics, tuple(np.asarray(data['simulated_prices'], dtype=float).tolist())
+
+
+@functools.lru_cache(maxsize=8)
+def _render_static(data_key):
+    """
+    Render everything in the report that depends only on the data fingerprint
+
+    Returns (ctx, sections): the formatting context and the rendered sections,
+    with None for sections holding per-render fields. Callers must not mutate ctx.
+    """
+    metrics, prices = data_key
+    data = dict(metrics)
+    data['simulated_prices'] = np.array(prices)
+
+    distribution_chart = generate_distribution_chart(data['simulated_prices'])
+    greeks_chart = generate_greeks_chart(data)
+
+    # Determine validation status; each threshold check is evaluated once
+    r_squared_ok = data['r_squared'] > 0.95
+    rmse_ok = data['rmse'] < 0.03
+    mae_ok = data['mae'] < 0.025
+    convergence_ok = data['convergence_rate'] > 0.99
+    validation_passed = rmse_ok and r_squared_ok
+    convergence_pct = data['convergence_rate'] * 100
+    theta = data['theta']
+
+    # Every field is formatted exactly once here; the sections only substitute strings
+    ctx = {
+        'status_color': '#27ae60' if validation_passed else '#e74c3c',
+        'status_text': 'PASSED' if validation_passed else 'REVIEW REQUIRED',
+        'convergence_pct_2f': f"{convergence_pct:.2f}",
+        'convergence_pct_4f': f"{convergence_pct:.4f}",
+        'mean_price_4f': f"{data['mean_price']:.4f}",
+        'std_dev_2f': f"{data['std_dev']:.2f}",
+        'std_dev_4f': f"{data['std_dev']:.4f}",
+        'ci_lower_4f': f"{data['ci_lower']:.4f}",
+        'ci_upper_4f': f"{data['ci_upper']:.4f}",
+        'var_95_2f': f"{data['var_95']:.2f}",
+        'cvar_95_2f': f"{data['cvar_95']:.2f}",
+        'delta_4f': f"{data['delta']:.4f}",
+        'gamma_4f': f"{data['gamma']:.4f}",
+        'vega_4f': f"{data['vega']:.4f}",
+        'theta_4f': f"{theta:.4f}",
+        'theta_abs_4f': f"{abs(theta):.4f}",
+        'rho_4f': f"{data['rho']:.4f}",
+        'delta_impact': 'Positive' if data['delta'] > 0 else 'Negative',
+        'gamma_impact': 'High' if data['gamma'] > 0.02 else 'Moderate',
+        'vega_impact': 'Significant' if abs(data['vega']) > 0.2 else 'Moderate',
+        'rho_impact': 'Positive' if data['rho'] > 0 else 'Negative',
+        'r_squared_6f': f"{data['r_squared']:.6f}",
+        'r_squared_color': '#27ae60' if r_squared_ok else '#e74c3c',
+        'r_squared_status': '✓ Pass' if r_squared_ok else '✗ Review',
+        'rmse_6f': f"{data['rmse']:.6f}",
+        'rmse_color': '#27ae60' if rmse_ok else '#e74c3c',
+        'rmse_status': '✓ Pass' if rmse_ok else '✗ Review',
+        'mae_6f': f"{data['mae']:.6f}",
+        'mae_color': '#27ae60' if mae_ok else '#e74c3c',
+        'mae_status': '✓ Pass' if mae_ok else '✗ Review',
+        'convergence_color': '#27ae60' if convergence_ok else '#f39c12',
+        'convergence_status': '✓ Pass' if convergence_ok else '⚠ Acceptable',
+        'distribution_chart': distribution_chart,
+        'greeks_chart': greeks_chart,
+    }
+
+    # Values shared with the console summary are formatted once in generate_monte_carlo_data
+    ctx.update((k, v) for k, v in data.items() if k.endswith('_fmt'))
+
+    sections = tuple(
+        None if per_render else section.format_map(ctx)
+        for section, per_render in zip(_REPORT_SECTIONS, _SECTION_IS_PER_RENDER)
+    )
+    return ctx, sections
+
+
+def _render_html(data, rng=_RNG):
+    """
+    Render the HTML report sections, reusing the cached data-only sections
+    """
+    ctx, sections = _render_static(_report_key(data))
+
+    # The timestamp, narrative values and convergence chart change on every render
+    ctx = dict(ctx)
+    ctx.update((field, build(data, rng)) for field, build in _PER_RENDER_BUILDERS.items())
+
+    return tuple(
+        section.format_map(ctx) if rendered is None else rendered
+        for section, rendered in zip(_REPORT_SECTIONS, sections)
+    )
+
+
+def _report_target(output_path):
+    """
+    Resolve the file the report is written to; REPORT_GZIP=1 adds a .gz suffix
+
+    Returns (path, compress).
+    """
+    compress = os.environ.get("REPORT_GZIP") == "1"
+    output_path = Path(output_path)
+    if compress:
+        output_path = output_path.with_suffix(output_path.suffix + '.gz')
+    return output_path, compress
+
+
+def _write_report(sections, output_path, compress=False):
+    """
+    Persist rendered report sections, gzip-compressed when compress is set
+    """
+    # Stream the encoded sections through a 1 MiB binary buffer, so the whole
+    # report reaches the artifact store in a single write
+    with open(output_path, 'wb', buffering=1 << 20) as raw, \
+            (gzip.GzipFile(fileobj=raw, mode='wb', compresslevel=1) if compress else nullcontext(raw)) as f:
+        for section in sections:
+            f.write(section.encode('utf-8'))
+
+
+def generate_html_report(data, output_path, rng=_RNG):
+    """
+    Generate professional HTML validation report
+
+    Returns the path of the written report.
+    """
+    output_path, compress = _report_target(output_path)
+    print(f"Generating HTML report: {output_path}")
 
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    # Identical data reuses the cached data-only sections instead of rebuilding them
+    sections = _render_html(data, rng)
+    _write_report(sections, output_path, compress)
 
     print(f"HTML report generated successfully: {output_path}")
+    return output_path
 
 
 def main():
@@ -819,16 +989,15 @@ def main():
     print("Monte Carlo Validation Report Generator")
     print("=" * 60)
 
-    # Setup artifact directory
-    artifact_dir = os.environ.get("DOMINO_ARTIFACTS_DIR", "/mnt/artifacts")
-    os.makedirs(artifact_dir, exist_ok=True)
+    # Setup artifact directory; skip mkdir in the common case where it exists
+    if not _ARTIFACT_DIR.is_dir():
+        _ARTIFACT_DIR.mkdir(parents=True, exist_ok=True)
 
     # Generate stochastic simulation data
     data = generate_monte_carlo_data()
 
     # Generate HTML report
-    artifact_path = os.path.join(artifact_dir, "validation_report.html")
-    generate_html_report(data, artifact_path)
+    artifact_path = generate_html_report(data, _ARTIFACT_PATH)
 
     print(f"\n{'='*60}")
     print(f"Validation complete!")
@@ -837,11 +1006,11 @@ def main():
 
     # Summary output
     print(f"Summary:")
-    print(f"  Simulations: {data['num_simulations']:,}")
-    print(f"  Mean Price: ${data['mean_price']:.2f}")
-    print(f"  95% CI: [${data['ci_lower']:.2f}, ${data['ci_upper']:.2f}]")
-    print(f"  R² Score: {data['r_squared']:.4f}")
-    print(f"  RMSE: {data['rmse']:.4f}")
+    print(f"  Simulations: {data['num_simulations_fmt']}")
+    print(f"  Mean Price: ${data['mean_price_fmt']}")
+    print(f"  95% CI: [${data['ci_lower_fmt']}, ${data['ci_upper_fmt']}]")
+    print(f"  R² Score: {data['r_squared_fmt']}")
+    print(f"  RMSE: {data['rmse_fmt']}")
 
     return 0
 